@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import sys
+
+# Modules for optional dependencies that can't be imported (and thus not collected by --doctest-modules) everywhere
+collect_ignore = []
+
+if sys.version_info < (3, 5):
+    collect_ignore.append('src/pyejabberd/aio.py')
+else:
+    try:
+        import aiohttp
+    except ImportError:
+        collect_ignore.append('src/pyejabberd/aio.py')
+
+try:
+    import requests
+except ImportError:
+    collect_ignore.append('src/pyejabberd/rest.py')
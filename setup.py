@@ -20,6 +20,18 @@ from setuptools import setup
 
 __version__ = '0.2.11'
 
+# Optionally compile the modules on the call path with Cython (PYEJABBERD_CYTHONIZE=1). The pure Python modules are
+# shipped as well and are used when the compiled extensions are not available.
+if os.environ.get('PYEJABBERD_CYTHONIZE') == '1':
+    from Cython.Build import cythonize
+    ext_modules = cythonize([
+        'src/pyejabberd/client.py',
+        'src/pyejabberd/core/definitions.py',
+        'src/pyejabberd/core/serializers.py',
+    ], compiler_directives={'language_level': 3})
+else:
+    ext_modules = []
+
 
 def read(*names, **kwargs):
     return io.open(
@@ -44,6 +56,7 @@ setup(
     package_dir={"": "src"},
     py_modules=[splitext(basename(path))[0] for path in glob('src/*.py')],
     include_package_data=True,
+    ext_modules=ext_modules,
     zip_safe=False,
     classifiers=[
         # complete classifier list: http://pypi.python.org/pypi?%3Aaction=list_classifiers
@@ -59,6 +72,7 @@ setup(
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.3',
         'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: Implementation :: CPython',
         'Programming Language :: Python :: Implementation :: PyPy',
         'Topic :: Utilities',
@@ -69,5 +83,7 @@ setup(
     ],
     install_requires=requirements,
     extras_require={
+        'async:python_version >= "3.5"': ['aiohttp'],
+        'rest': ['requests'],
     }
 )
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+
+import asyncio
+
+import aiohttp
+
+from . import defaults
+from .client import EjabberdAPIClient
+from .compat import import_xmlrpc_client
+from .transport import loads
+
+xmlrpc_client = import_xmlrpc_client()
+
+
+class AsyncEjabberdAPIClient(EjabberdAPIClient):
+    """
+    Asyncio based Python Client for the Ejabberd XML-RPC API (requires Python 3.5+ and aiohttp).
+
+    Exposes the same methods as :py:class:EjabberdAPIClient, but every API method returns a coroutine, which
+    allows many calls to be in flight concurrently on a single event loop.
+    """
+    def __init__(self, host, port, username, password, user_domain, protocol=None, verbose=False,
+                 connection_limit=None):
+        """
+        Constructor
+        :param host:
+        :type host: str|unicode
+        :param port:
+        :type port: int
+        :param username:
+        :type username: str|unicode
+        :param password:
+        :type password: str|unicode
+        :param user_domain:
+        :type user_domain: str|unicode
+        :param protocol: http or https
+        :type protocol: str|unicode
+        :param verbose:
+        :type verbose: bool
+        :param connection_limit: The maximum number of simultaneous connections to the XML-RPC endpoint
+        :type connection_limit: int
+        """
+        super(AsyncEjabberdAPIClient, self).__init__(host, port, username, password, user_domain,
+                                                     protocol=protocol, verbose=verbose)
+        self.connection_limit = connection_limit or defaults.ASYNC_CONNECTION_LIMIT
+        self._session = None
+
+    @property
+    def session(self):
+        """
+        Returns the HTTP session that is used to perform the calls to the XML-RPC endpoint
+        :rtype: :py:class:aiohttp.ClientSession
+        :return: the HTTP session that is used to perform the calls to the XML-RPC endpoint
+        """
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @property
+    def proxy(self):
+        raise TypeError('AsyncEjabberdAPIClient performs its calls through its aiohttp session, not an XML-RPC proxy')
+
+    def batch(self):
+        raise TypeError('AsyncEjabberdAPIClient does not support batching calls, use asyncio.gather instead')
+
+    def __enter__(self):
+        raise TypeError('Use "async with" to use AsyncEjabberdAPIClient as a context manager')
+
+    def __exit__(self, exc_type, exc_value, traceback):  # pragma: no cover
+        raise TypeError('Use "async with" to use AsyncEjabberdAPIClient as a context manager')
+
+    async def close(self):
+        """
+        Closes the underlying HTTP session
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def register_many(self, users, host, concurrency=None):
+        """
+        Registers multiple users to the ejabberd server concurrently
+        :param users: The (username, password) tuples for the new users
+        :type users: Iterable
+        :param host: The XMPP_DOMAIN
+        :type host: str|unicode
+        :param concurrency: The maximum number of registrations in flight, defaults to the connection limit
+        :type concurrency: int
+        :rtype: list
+        :return: A boolean per user indicating if the registration has succeeded, or the raised exception
+        """
+        return await self._call_many(self.register, [(user, host, password) for user, password in users],
+                                     concurrency)
+
+    async def unregister_many(self, users, host, concurrency=None):
+        """
+        UnRegisters multiple users from the ejabberd server concurrently
+        :param users: The usernames of the users
+        :type users: Iterable
+        :param host: The XMPP_DOMAIN
+        :type host: str|unicode
+        :param concurrency: The maximum number of unregistrations in flight, defaults to the connection limit
+        :type concurrency: int
+        :rtype: list
+        :return: A boolean per user indicating if the unregistration has succeeded, or the raised exception
+        """
+        return await self._call_many(self.unregister, [(user, host) for user in users], concurrency)
+
+    async def _call_many(self, method, arguments_list, concurrency):
+        """
+        Internal method used to call an api method concurrently for multiple sets of arguments
+        :param method: The api method to call
+        :param arguments_list: The positional arguments for every call
+        :type arguments_list: list
+        :param concurrency: The maximum number of calls in flight, defaults to the connection limit
+        :type concurrency: int
+        :rtype: list
+        :return: The result, or the raised exception, for every call
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.connection_limit)
+
+        async def call(arguments):
+            async with semaphore:
+                return await method(*arguments)
+
+        return await asyncio.gather(*[call(arguments) for arguments in arguments_list], return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _call_api(self, api_class, **kwargs):
+        """
+        Internal method used to perform api calls
+        :param api_class:
+        :type api_class: py:class:API
+        :param kwargs:
+        :type kwargs: dict
+        :rtype: object
+        :return: Returns return value of the XMLRPC Method call
+        """
+        api, arguments = self._prepare_api_call(api_class, kwargs)
+
+        # Build request body
+        body = xmlrpc_client.dumps(self._get_call_params(api, arguments), str(api.method))
+
+        # Perform call
+        async with self.session.post(self.service_url, data=body.encode('utf-8'),
+                                     headers={'Content-Type': 'text/xml'}) as http_response:
+            if http_response.status != 200:
+                raise xmlrpc_client.ProtocolError(self.service_url, http_response.status, http_response.reason,
+                                                  http_response.headers)
+            data = await http_response.read()
+
+        response = loads(data)[0]
+
+        return self._process_response(api, arguments, response)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+
+from six import get_unbound_function
+
+from .contract import EjabberdAPIContract
+
+
+class EjabberdAPIBatch(object):
+    """
+    Collects API calls and performs them in a single 'system.multicall' request when the context is exited.
+
+    Exposes the same API methods as the client it was created from. After the context has been exited, 'results'
+    contains the result of every collected call, in order. Calls that failed have the raised exception in their place.
+    """
+    def __init__(self, client):
+        """
+        Constructor
+        :param client: The client that will perform the multicall request
+        :type client: EjabberdAPIClient
+        """
+        self._client = client
+        self._calls = []
+        self.results = None
+
+    def __getattr__(self, name):
+        if name not in EjabberdAPIContract.__abstractmethods__:
+            raise AttributeError(name)
+        # Bind the client's API method to this batch, so that its call to _call_api is collected
+        method = get_unbound_function(getattr(type(self._client), name))
+        return lambda *args, **kwargs: method(self, *args, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.results = self._client._call_api_multi(self._calls) if self._calls else []
+
+    def _call_api(self, api_class, **kwargs):
+        """
+        Internal method used to collect api calls
+        :param api_class:
+        :type api_class: py:class:API
+        :param kwargs:
+        :type kwargs: dict
+        """
+        self._calls.append(self._client._prepare_api_call(api_class, kwargs))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from .core.errors import IllegalArgumentError
+from .definitions import Register
+
+
+def validate_registrations(users, passwords, hosts):
+    """
+    Validates the arguments for a batch of registrations up front, so that an invalid entry is reported before any of
+      the registrations has been sent to the server
+    :param users: The usernames for the new users
+    :type users: Iterable
+    :param passwords: The passwords for the new users
+    :type passwords: Iterable
+    :param hosts: The XMPP_DOMAIN for every new user
+    :type hosts: Iterable
+    :raises IllegalArgumentError: On the first invalid registration
+    """
+    users, passwords, hosts = list(users), list(passwords), list(hosts)
+    if not len(users) == len(passwords) == len(hosts):
+        raise IllegalArgumentError('users, passwords and hosts should have the same length')
+
+    for i, (user, password, host) in enumerate(zip(users, passwords, hosts)):
+        arguments = {'user': user, 'host': host, 'password': password}
+        try:
+            for argument_name, _, to_api in Register.arguments_spec:
+                to_api(arguments[argument_name])
+        except ValueError as e:
+            raise IllegalArgumentError('Invalid registration at index %d: %s' % (i, e))
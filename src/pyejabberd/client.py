@@ -1,21 +1,23 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals, print_function
-import copy
-
-from builtins import range
 
 from .compat import urlparse
-from .compat import xmlrpc_client
+from .compat import import_xmlrpc_client
 
 from . import contract, definitions, defaults
-from .core.definitions import API, APIArgument
-from .core.errors import IllegalArgumentError
+from .batch import EjabberdAPIBatch
+
+# API instances are stateless, so a single instance per API class is shared by all calls
+_API_CACHE = {}
 
 
 class EjabberdAPIClient(contract.EjabberdAPIContract):
     """
     Python Client for the Ejabberd XML-RPC API
     """
+    # The port that get_instance uses when the service_url does not contain one
+    default_port = defaults.XMLRPC_API_PORT
+
     def __init__(self, host, port, username, password, user_domain, protocol=None, verbose=False):
         """
         Constructor
@@ -36,15 +38,17 @@ class EjabberdAPIClient(contract.EjabberdAPIContract):
         """
         self.host = host
         self.port = port
-        self.username = username
-        self.password = password
-        self.user_domain = user_domain
+        self._username = username
+        self._password = password
+        self._user_domain = user_domain
         self.protocol = protocol or defaults.XMLRPC_API_PROTOCOL
         self.verbose = verbose
         self._proxy = None
+        self._transport = None
+        self._build_auth()
 
-    @staticmethod
-    def get_instance(service_url, verbose=False):
+    @classmethod
+    def get_instance(cls, service_url, verbose=False):
         """
         Returns a EjabberdAPIClient instance based on a '12factor app' compliant service_url
 
@@ -80,15 +84,14 @@ class EjabberdAPIClient(contract.EjabberdAPIContract):
             host, port = server_parts
             port = int(port)
         else:
-            host, port = server_parts[0], defaults.XMLRPC_API_PORT
+            host, port = server_parts[0], cls.default_port
 
         path_parts = o.path.lstrip('/').split('/')
         assert len(path_parts) == 1, fmt_error
 
         user_domain = path_parts[0]
 
-        return EjabberdAPIClient(host, port, username, password, user_domain, protocol=protocol,
-                                 verbose=verbose)
+        return cls(host, port, username, password, user_domain, protocol=protocol, verbose=verbose)
 
     @property
     def service_url(self):
@@ -106,20 +109,93 @@ class EjabberdAPIClient(contract.EjabberdAPIContract):
         :return the proxy object that is used to perform the calls to the XML-RPC endpoint
         """
         if self._proxy is None:
-            self._proxy = xmlrpc_client.ServerProxy(self.service_url, verbose=(1 if self.verbose else 0))
+            xmlrpc_client = import_xmlrpc_client()
+            from .transport import Transport, SafeTransport
+            self._transport = SafeTransport() if self.protocol == 'https' else Transport()
+            self._proxy = xmlrpc_client.ServerProxy(self.service_url, transport=self._transport,
+                                                    verbose=(1 if self.verbose else 0))
         return self._proxy
 
+    def close(self):
+        """
+        Closes the HTTP connection that the proxy keeps alive between calls. A new connection will be opened on the
+          next call. On Python 2.6 the transport opens a new connection for every call, so there is nothing to close.
+        """
+        if self._proxy is not None:
+            # ServerProxy('close') only exists since Python 2.7, on 2.6 it would be sent as an XML-RPC call, so close
+            # the transport directly
+            close = getattr(self._transport, 'close', None)
+            if close is not None:
+                close()
+            self._proxy = None
+            self._transport = None
+
+    def batch(self):
+        """
+        Returns a context manager that collects the API calls made on it and performs them in a single
+          'system.multicall' request when the context is exited. The results are available in its 'results' attribute.
+
+            with client.batch() as batch:
+                batch.register(user='alice', host='example.com', password='secret')
+                batch.register(user='bob', host='example.com', password='secret')
+            alice_registered, bob_registered = batch.results
+
+        :rtype: EjabberdAPIBatch
+        :return: A batch bound to this client
+        """
+        return EjabberdAPIBatch(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def username(self):
+        return self._username
+
+    @username.setter
+    def username(self, username):
+        self._username = username
+        self._build_auth()
+
+    @property
+    def password(self):
+        return self._password
+
+    @password.setter
+    def password(self, password):
+        self._password = password
+        self._build_auth()
+
+    @property
+    def user_domain(self):
+        return self._user_domain
+
+    @user_domain.setter
+    def user_domain(self, user_domain):
+        self._user_domain = user_domain
+        self._build_auth()
+
     @property
     def auth(self):
         """
-        Returns a dictionary containing the basic authorization info
+        Returns a dictionary containing the basic authorization info. It is rebuilt only when the credentials change
+          and is shared by all calls, so it must not be mutated.
         :rtype: dict
         :return: a dictionary containing the basic authorization info
         """
-        return {
-            'user': self.username,
-            'server': self.user_domain,
-            'password': self.password
+        return self._auth
+
+    def _build_auth(self):
+        """
+        Internal method to (re)build the dictionary containing the basic authorization info
+        """
+        self._auth = {
+            'user': self._username,
+            'server': self._user_domain,
+            'password': self._password
         }
 
     def echo(self, sentence):
@@ -404,22 +480,7 @@ class EjabberdAPIClient(contract.EjabberdAPIContract):
         :rtype: dict
         :return: The serialized arguments
         """
-        serialized_arguments = {}
-
-        for i in range(len(api.arguments)):
-            argument_descriptor = api.arguments[i]
-            assert isinstance(argument_descriptor, APIArgument)
-
-            # Validate argument presence
-            argument_name = str(argument_descriptor.name)
-            if argument_descriptor.required and argument_name not in arguments:
-                raise IllegalArgumentError('Missing required argument "%s"' % argument_name)
-
-            # Serializer argument value
-            serialized_arguments[argument_descriptor.name] = \
-                argument_descriptor.serializer_class().to_api(arguments.get(argument_name))
-
-        return serialized_arguments
+        return api._serialize_arguments(arguments)
 
     def _report_method_call(self, method, arguments):
         """
@@ -433,47 +494,102 @@ class EjabberdAPIClient(contract.EjabberdAPIContract):
         if self.verbose:
             print('===> %s(%s)' % (method, ', '.join(['%s=%s' % (key, value) for (key, value) in arguments.items()])))
 
-    def _call_api(self, api_class, **kwargs):
+    def _prepare_api_call(self, api_class, kwargs):
         """
-        Internal method used to perform api calls
+        Internal method to instantiate an api and to transform, validate and serialize its arguments
         :param api_class:
         :type api_class: py:class:API
         :param kwargs:
         :type kwargs: dict
-        :rtype: object
-        :return: Returns return value of the XMLRPC Method call
+        :rtype: tuple
+        :return: A tuple containing the api instance and the serialized arguments
         """
-        # Validate api_class
-        assert issubclass(api_class, API)
+        # Retrieve api instance
+        api = _API_CACHE.get(api_class)
+        if api is None:
+            api = _API_CACHE[api_class] = api_class()
 
-        # Create api instance
-        api = api_class()
-
-        # Copy arguments
-        arguments = copy.copy(kwargs)
-
-        # Transform arguments
-        arguments = api.transform_arguments(**arguments)
+        # Transform arguments (kwargs is a fresh dict that is owned by this call, so it needs no copy). The default
+        # implementation returns them as is, so it is only called when overridden.
+        arguments = api.transform_arguments(**kwargs) if api._has_transform_arguments else kwargs
 
         # Validate and serialize arguments
         arguments = self._validate_and_serialize_arguments(api, arguments)
 
-        # Retrieve method
-        method = getattr(self.proxy, str(api.method))
-
         # Print method call with arguments
         self._report_method_call(api.method, arguments)
 
-        # Perform call
+        return api, arguments
+
+    def _get_call_params(self, api, arguments):
+        """
+        Internal method to build the XML-RPC parameters for a call
+        :param api: An instance of an API class
+        :param arguments: The serialized arguments
+        :type arguments: dict
+        :rtype: tuple
+        :return: The parameters to pass to the XML-RPC method
+        """
         if not api.authenticate:
-            response = method(arguments)
-        else:
-            response = method(self.auth, arguments)
+            return (arguments,)
+        return self.auth, arguments
 
-        # Validate response
-        api.validate_response(api, arguments, response)
+    def _process_response(self, api, arguments, response):
+        """
+        Internal method to validate and transform the response of an api call
+        :param api: An instance of an API class
+        :param arguments: The serialized arguments
+        :type arguments: dict
+        :param response: The raw XML-RPC response
+        :type response: object
+        :rtype: object
+        :return: The transformed response
+        """
+        # Validate response (the default implementation does nothing, so it is only called when overridden)
+        if api._has_validate_response:
+            api.validate_response(api, arguments, response)
 
         # Transform response
-        result = api.transform_response(api, arguments, response)
+        return api.transform_response(api, arguments, response)
 
-        return result
+    def _call_api(self, api_class, **kwargs):
+        """
+        Internal method used to perform api calls
+        :param api_class:
+        :type api_class: py:class:API
+        :param kwargs:
+        :type kwargs: dict
+        :rtype: object
+        :return: Returns return value of the XMLRPC Method call
+        """
+        api, arguments = self._prepare_api_call(api_class, kwargs)
+
+        # Perform call. ServerProxy.__getattr__ wraps the method name in a new _Method object on every access, which
+        # just forwards to the (name mangled) private ServerProxy.__request, so call that directly.
+        response = self.proxy._ServerProxy__request(str(api.method), self._get_call_params(api, arguments))
+
+        return self._process_response(api, arguments, response)
+
+    def _call_api_multi(self, calls):
+        """
+        Internal method used to perform multiple api calls in a single 'system.multicall' request
+        :param calls: A list of (api, arguments) tuples, as returned by _prepare_api_call
+        :type calls: list
+        :rtype: list
+        :return: A list containing the result, or the raised exception, for every call
+        """
+        multicall_arguments = [{'methodName': str(api.method), 'params': list(self._get_call_params(api, arguments))}
+                               for api, arguments in calls]
+
+        # Perform call
+        responses = self.proxy._ServerProxy__request('system.multicall', (multicall_arguments,))
+
+        results = []
+        for (api, arguments), response in zip(calls, responses):
+            try:
+                if isinstance(response, dict):
+                    raise import_xmlrpc_client().Fault(response['faultCode'], response['faultString'])
+                results.append(self._process_response(api, arguments, response[0]))
+            except Exception as e:
+                results.append(e)
+        return results
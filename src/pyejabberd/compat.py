@@ -6,12 +6,20 @@ try:
 except ImportError:  # pragma: no cover
     from urlparse import urlparse
 
-try:
-    import xmlrpc.client as xmlrpc_client
-except ImportError:  # pragma: no cover
-    import xmlrpclib as xmlrpc_client
-
 try:
     from unittest import TestCase, skipIf, main as run_unittests
 except ImportError:  # pragma: no cover
     from unittest2 import TestCase, skipIf, main as run_unittests
+
+
+def import_xmlrpc_client():
+    """
+    Imports the XML-RPC client module. This is deferred until it is first needed, as it pulls in the http, ssl and xml
+      modules, which slows down importing pyejabberd.
+    :return: The xmlrpc.client (or xmlrpclib) module
+    """
+    try:
+        import xmlrpc.client as xmlrpc_client
+    except ImportError:  # pragma: no cover
+        import xmlrpclib as xmlrpc_client
+    return xmlrpc_client
@@ -6,16 +6,20 @@ from .serializers import StringSerializer, IntegerSerializer, PositiveIntegerSer
 
 
 class StringArgument(APIArgument):
+    __slots__ = ()
     serializer_class = StringSerializer
 
 
 class IntegerArgument(APIArgument):
+    __slots__ = ()
     serializer_class = IntegerSerializer
 
 
 class PositiveIntegerArgument(APIArgument):
+    __slots__ = ()
     serializer_class = PositiveIntegerSerializer
 
 
 class BooleanArgument(APIArgument):
+    __slots__ = ()
     serializer_class = BooleanSerializer
@@ -6,6 +6,8 @@ from six import with_metaclass
 
 from enum import Enum as BaseEnum
 
+from .errors import IllegalArgumentError
+
 
 class Enum(BaseEnum):
     @classmethod
@@ -28,17 +30,133 @@ class APIArgumentSerializer(with_metaclass(ABCMeta, object)):  # pragma: no cove
 
 
 class APIArgument(with_metaclass(ABCMeta, object)):
+    __slots__ = ('name', 'description', 'required', '_serializer')
+
     def __init__(self, name, description=None, required=True):
         self.name = name
         self.description = description
         self.required = required
+        self._serializer = None
 
     @abstractproperty
     def serializer_class(self):  # pragma: no cover
         pass
 
+    @property
+    def serializer(self):
+        """
+        Returns the (stateless) serializer instance for this argument, which is created once and then reused
+        :rtype: APIArgumentSerializer
+        :return: The serializer instance for this argument
+        """
+        if self._serializer is None:
+            self._serializer = self.serializer_class()
+        return self._serializer
+
+
+def _build_arguments_serializer(arguments_spec):
+    """
+    Generates a function that validates and serializes a dictionary of arguments for a fixed set of argument
+      declarations, with the argument names, presence checks and serializers inlined.
+    :param arguments_spec: A (name, required, to_api) tuple per argument
+    :type arguments_spec: tuple
+    :rtype: function
+    :return: A function that takes the arguments dictionary and returns the serialized arguments
+    """
+    namespace = {'IllegalArgumentError': IllegalArgumentError}
+    lines = ['def serialize_arguments(arguments):']
+    for i, (argument_name, required, to_api) in enumerate(arguments_spec):
+        namespace['to_api_%d' % i] = to_api
+        if required:
+            lines.append('    if %r not in arguments:' % argument_name)
+            lines.append('        raise IllegalArgumentError(%r)' % ('Missing required argument "%s"' % argument_name))
+        lines.append('    value_%d = to_api_%d(arguments.get(%r))' % (i, i, argument_name))
+    lines.append('    return {%s}' % ', '.join('%r: value_%d' % (argument_name, i)
+                                             for i, (argument_name, _, _) in enumerate(arguments_spec)))
+    exec('\n'.join(lines), namespace)
+    return namespace['serialize_arguments']
+
+
+def _overrides_default(cls, name):
+    """
+    Returns whether an API class (or one of its bases) overrides the default implementation of a handler method of API
+    :param cls: The API class
+    :param name: The name of the handler method
+    :type name: str
+    :rtype: bool
+    :return: True if the handler method is overridden
+    """
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass is not API
+    return False
+
+
+def _build_arguments_spec(name, arguments):
+    """
+    Flattens the argument declarations of an API class into a table of plain (name, required, to_api) tuples
+    :param name: The name of the API class
+    :type name: str
+    :param arguments: The APIArgument objects of the API class
+    :type arguments: Iterable
+    :rtype: tuple
+    :return: A (name, required, to_api) tuple per argument
+    """
+    for argument in arguments:
+        if not isinstance(argument, APIArgument):
+            raise TypeError('Invalid argument declaration for API %s: %r' % (name, argument))
+    return tuple((str(argument.name), argument.required, argument.serializer.to_api) for argument in arguments)
+
+
+def _serialize_arguments_lazily(self, arguments):
+    """
+    Argument serializer of API classes that declare their arguments through a property, which can only be read from an
+      instance. It builds the argument table and the specialized serializer on first use and then replaces itself.
+    """
+    cls = type(self)
+    cls.arguments_spec = _build_arguments_spec(cls.__name__, self.arguments)
+    cls._serialize_arguments = staticmethod(_build_arguments_serializer(cls.arguments_spec))
+    return self._serialize_arguments(arguments)
+
+
+class APIMeta(ABCMeta):
+    """
+    Metaclass for API classes, which flattens the (fixed) argument declarations of concrete API classes into a table
+      of plain (name, required, to_api) tuples and generates a specialized argument serializer at class creation time,
+      so they don't have to be inspected on every call.
+    """
+    def __init__(cls, name, bases, namespace):
+        super(APIMeta, cls).__init__(name, bases, namespace)
+
+        if 'arguments' in cls.__abstractmethods__:
+            # Abstract API class
+            return
+
+        cls._has_transform_arguments = _overrides_default(cls, 'transform_arguments')
+        cls._has_validate_response = _overrides_default(cls, 'validate_response')
+        cls._has_normalize_rest_response = _overrides_default(cls, 'normalize_rest_response')
+
+        arguments = cls.arguments
+        if isinstance(arguments, (list, tuple)):
+            cls.arguments_spec = _build_arguments_spec(name, arguments)
+            cls._serialize_arguments = staticmethod(_build_arguments_serializer(cls.arguments_spec))
+        elif isinstance(arguments, property):
+            # Arguments declared through a property are only known once the API is instantiated
+            cls.arguments_spec = None
+            cls._serialize_arguments = _serialize_arguments_lazily
+        else:
+            raise TypeError('Invalid arguments declaration for API %s, expected a list, tuple or property: %r'
+                            % (name, arguments))
+
+
+class API(with_metaclass(APIMeta, object)):
+    __slots__ = ()
+
+    # Whether the default handler methods are overridden, which APIMeta determines for every concrete API class
+    _has_transform_arguments = False
+    _has_validate_response = False
+    _has_normalize_rest_response = False
 
-class API(with_metaclass(ABCMeta, object)):
     @abstractproperty
     def method(self):  # pragma: no cover
         """
@@ -55,6 +173,15 @@ class API(with_metaclass(ABCMeta, object)):
         :return: An iterable containing the arguments
         """
 
+    @property
+    def rest_path(self):
+        """
+        Returns the path of this API, relative to the endpoint of ejabberd's REST API (mod_http_api)
+        :rtype: str
+        :return: Path of the REST API method to call
+        """
+        return self.method
+
     @property
     def authenticate(self):
         """
@@ -87,6 +214,45 @@ class API(with_metaclass(ABCMeta, object)):
         :return:
         """
 
+    def normalize_rest_response(self, api, arguments, response):
+        """
+        Handler method to convert a response of ejabberd's REST API into the shape of the XML-RPC response, so it can
+          be processed by 'validate_response' and 'transform_response'. By default, the REST response is expected to
+          be a result code (or a message string, which is only returned on success).
+        :param api: The api object that has been used for the call
+        :type api: py:class:API
+        :param arguments: The dictionary containing the arguments that have ben used to perform the call
+        :type arguments: dict
+        :param response: The decoded JSON response
+        :type response: object
+        :rtype: object
+        :return:
+        """
+        if isinstance(response, int):
+            return {'res': response}
+        return {'res': 0}
+
+    def normalize_rest_error(self, api, arguments, status_code, error):
+        """
+        Handler method to convert an error of ejabberd's REST API into the shape of the XML-RPC response. The REST API
+          reports a failed result tuple command as an HTTP error (e.g. 409 when registering an existing user), where
+          XML-RPC returns result code 1. By default, 404 (not found) and 409 (conflict) errors of APIs that return a
+          result code are converted. For all other errors None is returned, and the HTTP error is raised.
+        :param api: The api object that has been used for the call
+        :type api: py:class:API
+        :param arguments: The dictionary containing the arguments that have ben used to perform the call
+        :type arguments: dict
+        :param status_code: The HTTP status code
+        :type status_code: int
+        :param error: The decoded JSON error, containing the error 'code' and 'message'
+        :type error: dict
+        :rtype: object
+        :return:
+        """
+        if status_code not in (404, 409) or self._has_normalize_rest_response:
+            return None
+        return {'res': 1}
+
     def transform_response(self, api, arguments, response):
         """
         Handler method to process the response. The output of this method will be returned as the output of the API
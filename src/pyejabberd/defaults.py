@@ -4,3 +4,5 @@ from __future__ import unicode_literals, print_function
 
 XMLRPC_API_PROTOCOL = 'https'
 XMLRPC_API_PORT = 4560
+REST_API_PORT = 5280
+ASYNC_CONNECTION_LIMIT = 32
@@ -14,22 +14,31 @@ from .utils import format_password_hash_sha
 
 
 class Echo(API):
+    __slots__ = ()
     method = 'echothisnew'
     arguments = [StringArgument('sentence')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'repeated': response}
+
     def transform_response(self, api, arguments, response):
         return response.get('repeated')
 
 
 class RegisteredUsers(API):
+    __slots__ = ()
     method = 'registered_users'
     arguments = [StringArgument('host')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'users': [{'username': username} for username in response]}
+
     def transform_response(self, api, arguments, response):
         return response.get('users', [])
 
 
 class Register(API):
+    __slots__ = ()
     method = 'register'
     arguments = [StringArgument('user'), StringArgument('host'), StringArgument('password')]
 
@@ -43,6 +52,7 @@ class Register(API):
 
 
 class UnRegister(API):
+    __slots__ = ()
     method = 'unregister'
     arguments = [StringArgument('user'), StringArgument('host')]
 
@@ -51,6 +61,7 @@ class UnRegister(API):
 
 
 class ChangePassword(API):
+    __slots__ = ()
     method = 'change_password'
     arguments = [StringArgument('user'), StringArgument('host'), StringArgument('newpass')]
 
@@ -59,6 +70,7 @@ class ChangePassword(API):
 
 
 class CheckPasswordHash(API):
+    __slots__ = ()
     method = 'check_password_hash'
     arguments = [StringArgument('user'), StringArgument('host'), StringArgument('passwordhash'),
                  StringArgument('hashmethod')]
@@ -76,6 +88,7 @@ class CheckPasswordHash(API):
 
 
 class SetNickname(API):
+    __slots__ = ()
     method = 'set_nickname'
     arguments = [StringArgument('user'), StringArgument('host'), StringArgument('nickname')]
 
@@ -83,34 +96,50 @@ class SetNickname(API):
         return response.get('res') == 0
 
 class ConnectedUsers(API):
+    __slots__ = ()
     method = 'connected_users'
     arguments = []
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'connected_users': [{'sessions': session} for session in response]}
+
     def transform_response(self, api, arguments, response):
         connected_users = response.get('connected_users', [])
 
         return [user["sessions"] for user in connected_users]
 
 class ConnectedUsersInfo(API):
+    __slots__ = ()
     method = 'connected_users_info'
     arguments = []
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'connected_users_info': [{'sessions': [{k: v} for k, v in session.items()]} for session in response]}
+
     def transform_response(self, api, arguments, response):
         connected_users_info = response.get('connected_users_info', [])
 
         return [user["sessions"] for user in connected_users_info]
 
 class ConnectedUsersNumber(API):
+    __slots__ = ()
     method = 'connected_users_number'
     arguments = []
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'num_sessions': response}
+
     def transform_response(self, api, arguments, response):
         return response.get('num_sessions')
 
 class UserSessionInfo(API):
+    __slots__ = ()
     method = 'user_sessions_info'
     arguments = [StringArgument('user'), StringArgument('host')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'sessions_info': [{'session': [{k: v} for k, v in session.items()]} for session in response]}
+
     def transform_response(self, api, arguments, response):
         sessions_info = response.get('sessions_info', [])
         return [
@@ -119,14 +148,19 @@ class UserSessionInfo(API):
         ]
 
 class MucOnlineRooms(API):
+    __slots__ = ()
     method = 'muc_online_rooms'
     arguments = [StringArgument('host')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'rooms': [{'room': room} for room in response]}
+
     def transform_response(self, api, arguments, response):
-        return [result_dict.get('room') for result_dict in response.get('rooms', {})]
+        return [result_dict['room'] for result_dict in response.get('rooms') or ()]
 
 
 class CreateRoom(API):
+    __slots__ = ()
     method = 'create_room'
     arguments = [StringArgument('name'), StringArgument('service'), StringArgument('host')]
 
@@ -135,6 +169,7 @@ class CreateRoom(API):
 
 
 class DestroyRoom(API):
+    __slots__ = ()
     method = 'destroy_room'
     arguments = [StringArgument('name'), StringArgument('service'), StringArgument('host')]
 
@@ -143,21 +178,23 @@ class DestroyRoom(API):
 
 
 class GetRoomOptions(API):
+    __slots__ = ()
     method = 'get_room_options'
     arguments = [StringArgument('name'), StringArgument('service')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'options': [{'option': [{'name': option['name']}, {'value': option['value']}]} for option in response]}
+
     def transform_response(self, api, arguments, response):
-        result = {}
-        for option_dict in response.get('options', []):
-            option = option_dict.get('option')
-            if option is None:
-                raise ValueError('Unexpected option in response: ' % str(option_dict))
-            name_dict, value_dict = option
-            result[name_dict['name']] = value_dict['value']
-        return result
+        option_dicts = response.get('options') or ()
+        options = [option_dict.get('option') for option_dict in option_dicts]
+        if None in options:
+            raise ValueError('Unexpected option in response: %s' % str(option_dicts[options.index(None)]))
+        return dict((name_dict['name'], value_dict['value']) for name_dict, value_dict in options)
 
 
 class ChangeRoomOption(API):
+    __slots__ = ()
     method = 'change_room_option'
     arguments = [StringArgument('name'), StringArgument('service'), MUCRoomArgument('option'), StringArgument('value')]
 
@@ -173,6 +210,7 @@ class ChangeRoomOption(API):
 
 
 class SetRoomAffiliation(API):
+    __slots__ = ()
     method = 'set_room_affiliation'
     arguments = [StringArgument('name'), StringArgument('service'), StringArgument('jid'),
                  AffiliationArgument('affiliation')]
@@ -182,9 +220,18 @@ class SetRoomAffiliation(API):
 
 
 class GetRoomAffiliations(API):
+    __slots__ = ()
     method = 'get_room_affiliations'
     arguments = [StringArgument('name'), StringArgument('service')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'affiliations': [{'affiliation': [
+            {'username': affiliation['username']},
+            {'domain': affiliation['domain']},
+            {'affiliation': affiliation['affiliation']},
+            {'reason': affiliation['reason']},
+        ]} for affiliation in response]}
+
     def transform_response(self, api, arguments, response):
         affiliations = response.get('affiliations', [])
         return [{
@@ -196,6 +243,7 @@ class GetRoomAffiliations(API):
 
 
 class AddRosterItem(API):
+    __slots__ = ()
     method = 'add_rosteritem'
     arguments = [StringArgument('localuser'), StringArgument('localserver'),
                  StringArgument('user'), StringArgument('server'),
@@ -206,6 +254,7 @@ class AddRosterItem(API):
 
 
 class DeleteRosterItem(API):
+    __slots__ = ()
     method = 'delete_rosteritem'
     arguments = [StringArgument('localuser'), StringArgument('localserver'),
                  StringArgument('user'), StringArgument('server')]
@@ -215,9 +264,13 @@ class DeleteRosterItem(API):
 
 
 class GetRoster(API):
+    __slots__ = ()
     method = 'get_roster'
     arguments = [StringArgument('user'), StringArgument('host')]
 
+    def normalize_rest_response(self, api, arguments, response):
+        return {'contacts': [{'contact': [{k: v} for k, v in contact.items()]} for contact in response]}
+
     def transform_response(self, api, arguments, response):
         roster = []
         for contact in response.get('contacts', []):
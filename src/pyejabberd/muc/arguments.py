@@ -6,8 +6,10 @@ from .serializers import MUCRoomOptionSerializer, AffiliationSerializer
 
 
 class MUCRoomArgument(APIArgument):
+    __slots__ = ()
     serializer_class = MUCRoomOptionSerializer
 
 
 class AffiliationArgument(APIArgument):
+    __slots__ = ()
     serializer_class = AffiliationSerializer
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+
+import requests
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import dumps as json_dumps, loads as json_loads
+
+from . import defaults
+from .client import EjabberdAPIClient
+
+
+class RESTEjabberdAPIClient(EjabberdAPIClient):
+    """
+    Python Client for the Ejabberd REST API (mod_http_api)
+
+    Exposes the same methods as :py:class:EjabberdAPIClient, but exchanges JSON with ejabberd's REST API instead of
+    XML-RPC, which is cheaper to serialize and parse. Responses are converted to the XML-RPC response shape by
+    API.normalize_rest_response (and errors that XML-RPC reports as a result code by API.normalize_rest_error), so
+    API methods return the same results as with the XML-RPC client. Other errors raise requests.HTTPError.
+    """
+    default_port = defaults.REST_API_PORT
+
+    def __init__(self, host, port, username, password, user_domain, protocol=None, verbose=False):
+        """
+        Constructor
+        :param host:
+        :type host: str|unicode
+        :param port:
+        :type port: int
+        :param username:
+        :type username: str|unicode
+        :param password:
+        :type password: str|unicode
+        :param user_domain:
+        :type user_domain: str|unicode
+        :param protocol: http or https
+        :type protocol: str|unicode
+        :param verbose:
+        :type verbose: bool
+        """
+        super(RESTEjabberdAPIClient, self).__init__(host, port, username, password, user_domain,
+                                                    protocol=protocol, verbose=verbose)
+        self._session = None
+
+    @property
+    def service_url(self):
+        """
+        Returns the FQDN to the Ejabberd server's REST API endpoint
+        :return:
+        """
+        return "%s://%s:%s/api/" % (self.protocol, self.host, self.port)
+
+    @property
+    def session(self):
+        """
+        Returns the HTTP session that is used to perform the calls to the REST API endpoint
+        :rtype: :py:class:requests.Session
+        :return: the HTTP session that is used to perform the calls to the REST API endpoint
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers['Content-Type'] = 'application/json'
+        return self._session
+
+    @property
+    def proxy(self):
+        raise TypeError('RESTEjabberdAPIClient performs its calls through its HTTP session, not an XML-RPC proxy')
+
+    def batch(self):
+        raise TypeError('The REST API does not support batching calls')
+
+    def close(self):
+        """
+        Closes the underlying HTTP session
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _call_api(self, api_class, **kwargs):
+        """
+        Internal method used to perform api calls
+        :param api_class:
+        :type api_class: py:class:API
+        :param kwargs:
+        :type kwargs: dict
+        :rtype: object
+        :return: Returns return value of the REST API call
+        """
+        api, arguments = self._prepare_api_call(api_class, kwargs)
+
+        # Perform call
+        auth = ('%s@%s' % (self.username, self.user_domain), self.password) if api.authenticate else None
+        http_response = self.session.post(self.service_url + api.rest_path, data=json_dumps(arguments), auth=auth)
+
+        if http_response.status_code >= 400:
+            error = self._decode_error(http_response)
+            response = None if error is None else \
+                api.normalize_rest_error(api, arguments, http_response.status_code, error)
+            if response is None:
+                http_response.raise_for_status()
+        else:
+            response = api.normalize_rest_response(api, arguments, json_loads(http_response.content))
+
+        return self._process_response(api, arguments, response)
+
+    @staticmethod
+    def _decode_error(http_response):
+        """
+        Internal method to decode the error that ejabberd's REST API returns in the body of an HTTP error response
+        :param http_response: The HTTP response
+        :type http_response: :py:class:requests.Response
+        :rtype: dict
+        :return: The error, or None if the body does not contain an ejabberd error
+        """
+        try:
+            error = json_loads(http_response.content)
+        except ValueError:
+            return None
+        if not isinstance(error, dict) or error.get('status') != 'error':
+            return None
+        return error
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, print_function
+
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:  # pragma: no cover
+    import xml.etree.ElementTree as ElementTree
+
+from .compat import import_xmlrpc_client
+
+xmlrpc_client = import_xmlrpc_client()
+
+
+def _parse_struct(element):
+    return dict((member.findtext('name'), _parse_value(member.find('value'))) for member in element)
+
+
+def _parse_array(element):
+    data = element.find('data')
+    return [] if data is None else [_parse_value(value) for value in data]
+
+
+def _parse_base64(element):
+    binary = xmlrpc_client.Binary()
+    binary.decode((element.text or '').encode('ascii'))
+    return binary
+
+
+def _parse_boolean(element):
+    text = (element.text or '').strip()
+    if text not in ('0', '1'):
+        raise TypeError('bad boolean value')
+    return text == '1'
+
+
+_VALUE_PARSERS = {
+    'string': lambda element: element.text or '',
+    'int': lambda element: int(element.text),
+    'i4': lambda element: int(element.text),
+    'i8': lambda element: int(element.text),
+    'boolean': _parse_boolean,
+    'double': lambda element: float(element.text),
+    'nil': lambda element: None,
+    'dateTime.iso8601': lambda element: xmlrpc_client.DateTime(element.text),
+    'base64': _parse_base64,
+    'struct': _parse_struct,
+    'array': _parse_array,
+}
+
+
+def _parse_value(element):
+    """
+    Converts a <value> element into the corresponding python object
+    :param element: The <value> element
+    :rtype: object
+    :return: The python object
+    """
+    if len(element) == 0:
+        # A value without type element is a string
+        return element.text or ''
+    typed_element = element[0]
+    try:
+        parser = _VALUE_PARSERS[typed_element.tag]
+    except KeyError:
+        raise ValueError('Unsupported XML-RPC type: %s' % typed_element.tag)
+    return parser(typed_element)
+
+
+def loads(data):
+    """
+    Parses an XML-RPC method response with ElementTree, which builds the tree in C, instead of xmlrpclib's Unmarshaller,
+      which handles every parser event in python.
+    :param data: The XML-RPC method response
+    :type data: bytes
+    :rtype: tuple
+    :return: The response parameters
+    """
+    root = ElementTree.fromstring(data)
+    fault = root.find('fault')
+    if fault is not None:
+        fault = _parse_value(fault.find('value'))
+        raise xmlrpc_client.Fault(fault['faultCode'], fault['faultString'])
+    return tuple(_parse_value(param.find('value')) for param in root.find('params'))
+
+
+def _parse_response(transport, response):
+    """
+    Reads and parses an XML-RPC method response with ElementTree
+    :param transport: The transport that received the response
+    :param response: The HTTP response
+    :rtype: tuple
+    :return: The response parameters
+    """
+    data = response.read()
+
+    if transport.verbose:  # pragma: no cover
+        print('body:', repr(data))
+
+    return loads(data)
+
+
+class Transport(xmlrpc_client.Transport):
+    """
+    XML-RPC transport over HTTP that parses responses with ElementTree
+    """
+    def parse_response(self, response):
+        # xmlrpclib's Transport is an old-style class on Python 2, so the base class is called explicitly
+        if response.getheader('Content-Encoding', '') == 'gzip':  # pragma: no cover
+            return xmlrpc_client.Transport.parse_response(self, response)
+        return _parse_response(self, response)
+
+
+class SafeTransport(xmlrpc_client.SafeTransport):
+    """
+    XML-RPC transport over HTTPS that parses responses with ElementTree
+    """
+    def parse_response(self, response):
+        if response.getheader('Content-Encoding', '') == 'gzip':  # pragma: no cover
+            return xmlrpc_client.SafeTransport.parse_response(self, response)
+        return _parse_response(self, response)
@@ -2,18 +2,43 @@
 from __future__ import unicode_literals, print_function
 import os
 import sys
+import threading
 
-from pyejabberd.compat import TestCase, skipIf
+try:
+    from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:  # pragma: no cover
+    from SimpleXMLRPCServer import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
-from pyejabberd import EjabberdAPIClient
-from pyejabberd.defaults import XMLRPC_API_PORT
+from pyejabberd.compat import TestCase, skipIf, import_xmlrpc_client
+
+from pyejabberd import EjabberdAPIClient, definitions
+from pyejabberd.defaults import XMLRPC_API_PORT, REST_API_PORT
 from pyejabberd.muc import MUCRoomOption
 from pyejabberd.errors import UserAlreadyRegisteredError
+from pyejabberd.bulk import validate_registrations
+from pyejabberd.core.definitions import API
+from pyejabberd.core.errors import IllegalArgumentError
 from pyejabberd.core.arguments import StringArgument, BooleanArgument, IntegerArgument, PositiveIntegerArgument
 from pyejabberd.muc.arguments import MUCRoomArgument
 from pyejabberd.muc.enums import AllowVisitorPrivateMessage, Affiliation
 from pyejabberd.utils import format_password_hash_md5, format_password_hash_sha
 from pyejabberd.contrib import ejabberd_testserver_is_up
+from pyejabberd.transport import loads
+
+try:
+    import asyncio
+    from pyejabberd.aio import AsyncEjabberdAPIClient
+except (ImportError, SyntaxError):  # pragma: no cover
+    AsyncEjabberdAPIClient = None
+
+try:
+    import json
+    import requests
+    from pyejabberd.rest import RESTEjabberdAPIClient
+except ImportError:  # pragma: no cover
+    RESTEjabberdAPIClient = None
 
 HOST = os.environ.get('PYEJABBERD_TESTS_HOST', 'localhost')
 PORT = int(os.environ.get('PYEJABBERD_TESTS_PORT', 4560))
@@ -452,6 +477,272 @@ class EjabberdAPITests(TestCase):
         self.assertEqual(roster, [])
 
 
+@skipIf(AsyncEjabberdAPIClient is None, 'aiohttp is not available')
+@skipIf(not ejabberd_testserver_is_up('%s://%s:%s' % (PROTOCOL, HOST, PORT)),
+        'Ejabberd XMLRPC Service is not reachable at %s://%s:%s' % (PROTOCOL, HOST, PORT))
+class AsyncEjabberdAPITests(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.api = AsyncEjabberdAPIClient(
+            host=HOST, port=PORT, username=USERNAME, password=PASSWORD, user_domain=XMPP_DOMAIN, protocol=PROTOCOL,
+            verbose=VERBOSE)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.api.close())
+        self.loop.close()
+
+    def test_echo(self):
+        sentence = '51@#211323$%^&*()'
+        result = self.loop.run_until_complete(self.api.echo(sentence))
+        self.assertIsNotNone(result)
+        self.assertEqual(result, sentence)
+
+    def test_register_unregister_user(self):
+        result = self.loop.run_until_complete(self.api.register('testuser_async', XMPP_DOMAIN, 'test'))
+        self.assertTrue(result)
+        result = self.loop.run_until_complete(self.api.unregister('testuser_async', XMPP_DOMAIN))
+        self.assertTrue(result)
+
+    def test_register_unregister_many(self):
+        usernames = ['testuser_async_%d' % i for i in range(10)]
+        results = self.loop.run_until_complete(
+            self.api.register_many([(username, 'test') for username in usernames], XMPP_DOMAIN, concurrency=4))
+        self.assertEqual(results, [True] * len(usernames))
+        results = self.loop.run_until_complete(self.api.unregister_many(usernames, XMPP_DOMAIN))
+        self.assertEqual(results, [True] * len(usernames))
+
+    def test_get_instance(self):
+        service_url = '%s://%s:%s@%s:%s/%s' % (PROTOCOL, USERNAME, PASSWORD, HOST, PORT, XMPP_DOMAIN)
+        api = AsyncEjabberdAPIClient.get_instance(service_url)
+        self.assertIsInstance(api, AsyncEjabberdAPIClient)
+
+
+@skipIf(AsyncEjabberdAPIClient is None, 'aiohttp is not available')
+class AsyncClientLibraryTests(TestCase):
+    def test_sync_only_members(self):
+        api = AsyncEjabberdAPIClient(host=HOST, port=PORT, username=USERNAME, password=PASSWORD,
+                                     user_domain=XMPP_DOMAIN)
+
+        for use_sync_member in (lambda: api.proxy, api.batch, api.__enter__):
+            error_thrown = False
+            try:
+                use_sync_member()
+            except TypeError:
+                error_thrown = True
+            self.assertTrue(error_thrown)
+
+
+@skipIf(AsyncEjabberdAPIClient is None, 'aiohttp is not available')
+class AsyncClientTests(TestCase):
+    def setUp(self):
+        xmlrpc_client = import_xmlrpc_client()
+        registered_users = set()
+
+        def register(auth, arguments):
+            if arguments['user'] in registered_users:
+                return {'res': 1}
+            registered_users.add(arguments['user'])
+            return {'res': 0}
+
+        def change_password(auth, arguments):
+            raise xmlrpc_client.Fault(1, 'error')
+
+        class RequestHandler(SimpleXMLRPCRequestHandler):
+            rpc_paths = ('/',)
+
+        # Local XML-RPC server
+        self.request_handler = RequestHandler
+        self.server = SimpleXMLRPCServer(('127.0.0.1', 0), requestHandler=RequestHandler, logRequests=False)
+        self.server.register_function(register, 'register')
+        self.server.register_function(change_password, 'change_password')
+        self.server.register_function(lambda auth, arguments: {'repeated': arguments['sentence']}, 'echothisnew')
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+
+        self.loop = asyncio.new_event_loop()
+        self.api = AsyncEjabberdAPIClient(host='127.0.0.1', port=self.server.server_address[1], username=USERNAME,
+                                          password=PASSWORD, user_domain=XMPP_DOMAIN, protocol='http')
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.api.close())
+        self.loop.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def test_echo(self):
+        sentence = '51@#211323$%^&*()\xfcF\xdfe'
+        self.assertEqual(self.loop.run_until_complete(self.api.echo(sentence)), sentence)
+
+    def test_register(self):
+        self.assertTrue(self.loop.run_until_complete(self.api.register('testuser_async', XMPP_DOMAIN, 'test')))
+
+        error_thrown = False
+        try:
+            self.loop.run_until_complete(self.api.register('testuser_async', XMPP_DOMAIN, 'test'))
+        except UserAlreadyRegisteredError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+    def test_register_many(self):
+        users = [('testuser_async_%d' % i, 'test') for i in range(5)] + [('testuser_async_0', 'test')]
+        results = self.loop.run_until_complete(self.api.register_many(users, XMPP_DOMAIN, concurrency=2))
+        self.assertEqual(results[:5], [True] * 5)
+        self.assertIsInstance(results[5], UserAlreadyRegisteredError)
+
+    def test_fault(self):
+        error_thrown = False
+        try:
+            self.loop.run_until_complete(self.api.change_password('testuser_async', XMPP_DOMAIN, 'newpass'))
+        except import_xmlrpc_client().Fault as e:
+            error_thrown = e.faultCode == 1 and e.faultString == 'error'
+        self.assertTrue(error_thrown)
+
+    def test_http_error(self):
+        self.request_handler.rpc_paths = ('/RPC2',)
+
+        error_thrown = False
+        try:
+            self.loop.run_until_complete(self.api.echo('sentence'))
+        except import_xmlrpc_client().ProtocolError as e:
+            error_thrown = e.errcode == 404
+        self.assertTrue(error_thrown)
+
+
+class BatchTests(TestCase):
+    def setUp(self):
+        xmlrpc_client = import_xmlrpc_client()
+        registered_users = set()
+
+        def register(auth, arguments):
+            if arguments['user'] in registered_users:
+                return {'res': 1}
+            registered_users.add(arguments['user'])
+            return {'res': 0}
+
+        def change_password(auth, arguments):
+            raise xmlrpc_client.Fault(1, 'error')
+
+        # Local XML-RPC server implementing system.multicall
+        self.server = SimpleXMLRPCServer(('127.0.0.1', 0), logRequests=False)
+        self.server.register_multicall_functions()
+        self.server.register_function(register, 'register')
+        self.server.register_function(change_password, 'change_password')
+        self.server.register_function(lambda auth, arguments: {'repeated': arguments['sentence']}, 'echothisnew')
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+
+        self.api = EjabberdAPIClient(host='127.0.0.1', port=self.server.server_address[1], username=USERNAME,
+                                     password=PASSWORD, user_domain=XMPP_DOMAIN, protocol='http')
+
+    def tearDown(self):
+        self.api.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def test_batch(self):
+        with self.api.batch() as batch:
+            batch.register('testuser_batch', XMPP_DOMAIN, 'test')
+            batch.register('testuser_batch', XMPP_DOMAIN, 'test')
+            batch.echo('sentence')
+            batch.change_password('testuser_batch', XMPP_DOMAIN, 'newpass')
+
+        self.assertEqual(len(batch.results), 4)
+        self.assertTrue(batch.results[0])
+        self.assertIsInstance(batch.results[1], UserAlreadyRegisteredError)
+        self.assertEqual(batch.results[2], 'sentence')
+        self.assertIsInstance(batch.results[3], import_xmlrpc_client().Fault)
+
+    def test_close(self):
+        self.assertTrue(self.api.register('testuser_close', XMPP_DOMAIN, 'test'))
+        self.api.close()
+        self.assertIsNone(self.api._transport)
+        self.assertEqual(self.api.echo('sentence'), 'sentence')
+
+
+@skipIf(RESTEjabberdAPIClient is None, 'requests is not available')
+class RESTClientTests(TestCase):
+    def setUp(self):
+        registered_users = set()
+        requests_made = self.requests_made = []
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                arguments = json.loads(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+                requests_made.append((self.path, arguments, self.headers['Authorization']))
+                if self.path == '/api/register':
+                    if arguments['user'] in registered_users:
+                        status, body = 409, {'status': 'error', 'code': 10090, 'message': 'User already exists'}
+                    else:
+                        registered_users.add(arguments['user'])
+                        status, body = 200, 'User successfully registered'
+                elif self.path == '/api/registered_users':
+                    status, body = 200, sorted(registered_users)
+                else:
+                    status, body = 400, {'status': 'error', 'code': 1, 'message': 'Unknown command'}
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        # Local HTTP server mimicking ejabberd's REST API
+        self.server = HTTPServer(('127.0.0.1', 0), RequestHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+
+        self.api = RESTEjabberdAPIClient(host='127.0.0.1', port=self.server.server_address[1], username=USERNAME,
+                                         password=PASSWORD, user_domain=XMPP_DOMAIN, protocol='http')
+
+    def tearDown(self):
+        self.api.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def test_register(self):
+        self.assertTrue(self.api.register('testuser_rest', XMPP_DOMAIN, 'test'))
+        path, arguments, authorization = self.requests_made[0]
+        self.assertEqual(path, '/api/register')
+        self.assertEqual(arguments, {'user': 'testuser_rest', 'host': XMPP_DOMAIN, 'password': 'test'})
+        self.assertTrue(authorization.startswith('Basic '))
+
+        self.assertEqual(self.api.registered_users(XMPP_DOMAIN), [{'username': 'testuser_rest'}])
+
+        error_thrown = False
+        try:
+            self.api.register('testuser_rest', XMPP_DOMAIN, 'test')
+        except UserAlreadyRegisteredError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+    def test_xmlrpc_only_members(self):
+        for use_xmlrpc_member in (lambda: self.api.proxy, self.api.batch):
+            error_thrown = False
+            try:
+                use_xmlrpc_member()
+            except TypeError:
+                error_thrown = True
+            self.assertTrue(error_thrown)
+
+    def test_get_instance_default_port(self):
+        api = RESTEjabberdAPIClient.get_instance('https://%s:%s@%s/%s' % (USERNAME, PASSWORD, HOST, XMPP_DOMAIN))
+        self.assertEqual(api.port, REST_API_PORT)
+
+    def test_http_error(self):
+        error_thrown = False
+        try:
+            self.api.echo('sentence')
+        except requests.HTTPError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+
 class LibraryTests(TestCase):
     def test_string_argument(self):
         serializer = self._test_argument_and_get_serializer(StringArgument)
@@ -592,6 +883,178 @@ class LibraryTests(TestCase):
         result = format_password_hash_md5('test')
         self.assertEqual(str(result), '98F6BCD4621D373CADE4E832627B4F6')
 
+    def test_auth_follows_credentials(self):
+        api = EjabberdAPIClient(host=HOST, port=PORT, username=USERNAME, password=PASSWORD, user_domain=XMPP_DOMAIN)
+        self.assertEqual(api.auth, {'user': USERNAME, 'server': XMPP_DOMAIN, 'password': PASSWORD})
+
+        api.password = 'newpass'
+        api.username = 'newuser'
+        api.user_domain = 'example.org'
+        self.assertEqual(api.auth, {'user': 'newuser', 'server': 'example.org', 'password': 'newpass'})
+
+    def test_batch_collects_calls(self):
+        api = EjabberdAPIClient(host=HOST, port=PORT, username=USERNAME, password=PASSWORD, user_domain=XMPP_DOMAIN)
+
+        with api.batch() as batch:
+            pass
+        self.assertEqual(batch.results, [])
+
+        error_thrown = False
+        try:
+            with api.batch() as batch:
+                batch.register('testuser_batch', XMPP_DOMAIN, 'test')
+                batch.register(123, XMPP_DOMAIN, 'test')
+        except ValueError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+        self.assertIsNone(batch.results)
+
+        error_thrown = False
+        try:
+            batch.proxy
+        except AttributeError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+    def test_get_room_options_malformed_option(self):
+        api = definitions.GetRoomOptions()
+        response = {'options': [{'option': [{'name': 'title'}, {'value': 'Room'}]}, {'invalid': []}]}
+        error_thrown = False
+        try:
+            api.transform_response(api, {}, response)
+        except ValueError as e:
+            error_thrown = 'invalid' in str(e) and 'title' not in str(e)
+        self.assertTrue(error_thrown)
+
+        self.assertEqual(api.transform_response(api, {}, {'options': None}), {})
+
+    def test_muc_online_rooms_without_rooms(self):
+        api = definitions.MucOnlineRooms()
+        self.assertEqual(api.transform_response(api, {}, {}), [])
+        self.assertEqual(api.transform_response(api, {}, {'rooms': None}), [])
+        self.assertEqual(api.transform_response(api, {}, {'rooms': [{'room': 'room1'}]}), ['room1'])
+
+    def test_normalize_rest_response(self):
+        api = definitions.GetRoomOptions()
+        response = api.normalize_rest_response(api, {}, [{'name': 'title', 'value': 'Room'},
+                                                         {'name': 'public', 'value': 'true'}])
+        self.assertEqual(api.transform_response(api, {}, response), {'title': 'Room', 'public': 'true'})
+
+        api = definitions.Register()
+        response = api.normalize_rest_response(api, {}, 'User testuser@example.com successfully registered')
+        self.assertTrue(api.transform_response(api, {}, response))
+
+        api = definitions.CheckPasswordHash()
+        response = api.normalize_rest_response(api, {}, 1)
+        self.assertFalse(api.transform_response(api, {}, response))
+
+    def test_xmlrpc_response_parser(self):
+        xmlrpc_client = import_xmlrpc_client()
+
+        response = {'res': 0, 'ok': True, 'ratio': 0.5, 'name': 'r\xf6\xf6m', 'empty': [],
+                    'options': [{'option': [{'name': 'title'}, {'value': 'Room'}]}]}
+        data = xmlrpc_client.dumps((response,), methodresponse=True)
+        if not isinstance(data, bytes):
+            # Python 2's xmlrpclib already returns the encoded response
+            data = data.encode('utf-8')
+        self.assertEqual(loads(data), (response,))
+
+        data = xmlrpc_client.dumps(xmlrpc_client.Fault(1, 'error'), methodresponse=True)
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        error_thrown = False
+        try:
+            loads(data)
+        except xmlrpc_client.Fault as e:
+            error_thrown = e.faultCode == 1 and e.faultString == 'error'
+        self.assertTrue(error_thrown)
+
+        data = (b'<?xml version="1.0"?><methodResponse><params><param><value><boolean>2</boolean></value></param>'
+                b'</params></methodResponse>')
+        error_thrown = False
+        try:
+            loads(data)
+        except TypeError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+    def test_api_arguments_spec(self):
+        spec = definitions.ChangePassword.arguments_spec
+        self.assertEqual([(name, required) for name, required, _ in spec],
+                         [('user', True), ('host', True), ('newpass', True)])
+        self.assertEqual(spec[0][2]('abc'), 'abc')
+
+    def test_validate_registrations(self):
+        self.assertIsNone(validate_registrations(['alice', 'bob'], ['secret1', 'secret2'], [XMPP_DOMAIN, XMPP_DOMAIN]))
+
+        error_thrown = False
+        try:
+            validate_registrations(['alice', 123], ['secret1', 'secret2'], [XMPP_DOMAIN, XMPP_DOMAIN])
+        except IllegalArgumentError as e:
+            error_thrown = 'index 1' in str(e)
+        self.assertTrue(error_thrown)
+
+        error_thrown = False
+        try:
+            validate_registrations(['alice'], ['secret1', 'secret2'], [XMPP_DOMAIN])
+        except IllegalArgumentError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+    def test_api_handler_overrides(self):
+        self.assertTrue(definitions.Register._has_validate_response)
+        self.assertFalse(definitions.Register._has_transform_arguments)
+        self.assertTrue(definitions.CheckPasswordHash._has_transform_arguments)
+        self.assertFalse(definitions.Echo._has_validate_response)
+
+        class DerivedRegister(definitions.Register):
+            pass
+        self.assertTrue(DerivedRegister._has_validate_response)
+
+    def test_api_subclass_attributes(self):
+        class StatefulAPI(API):
+            method = 'stateful'
+            arguments = []
+
+            def __init__(self):
+                self.calls = 0
+
+        self.assertEqual(StatefulAPI().calls, 0)
+
+    def test_api_property_arguments(self):
+        class PropertyAPI(API):
+            method = 'property'
+
+            @property
+            def arguments(self):
+                return [StringArgument('sentence')]
+
+        self.assertFalse(PropertyAPI._has_transform_arguments)
+        api, arguments = EjabberdAPIClient('localhost', PORT, USERNAME, PASSWORD, XMPP_DOMAIN)._prepare_api_call(
+            PropertyAPI, {'sentence': 'foo'})
+        self.assertEqual(arguments, {'sentence': 'foo'})
+        self.assertEqual([name for name, _, _ in PropertyAPI.arguments_spec], ['sentence'])
+
+    def test_invalid_api_argument_declaration(self):
+        error_thrown = False
+        try:
+            class InvalidAPI(API):
+                method = 'invalid'
+                arguments = ['user']
+        except TypeError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
+    def test_non_list_api_arguments_declaration(self):
+        error_thrown = False
+        try:
+            class GeneratorAPI(API):
+                method = 'generator'
+                arguments = (argument for argument in [StringArgument('user')])
+        except TypeError:
+            error_thrown = True
+        self.assertTrue(error_thrown)
+
     def _test_argument_and_get_serializer(self, argument_class):
         arg_name = 'arg_name'
         arg_description = 'arg_description'